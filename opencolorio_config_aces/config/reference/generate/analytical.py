@@ -10,6 +10,13 @@ reference *OpenColorIO* config.
 
 import itertools
 import logging
+from collections import defaultdict
+from operator import itemgetter
+
+try:
+    import PyOpenColorIO as ocio
+except ImportError:  # pragma: no cover
+    ocio = None
 
 from opencolorio_config_aces.config.generation import (
     ConfigData, colorspace_factory, generate_config)
@@ -18,8 +25,7 @@ from opencolorio_config_aces.config.reference.discover.graph import (
 from opencolorio_config_aces.config.reference import (
     ColorspaceDescriptionStyle, build_aces_conversion_graph,
     classify_aces_ctl_transforms, conversion_path,
-    discover_aces_ctl_transforms, filter_nodes, filter_ctl_transforms,
-    node_to_ctl_transform)
+    discover_aces_ctl_transforms, filter_ctl_transforms, node_to_ctl_transform)
 from opencolorio_config_aces.config.reference.generate.config import (
     ACES_CONFIG_BUILTIN_TRANSFORM_NAME_SEPARATOR,
     ACES_CONFIG_COLORSPACE_NAME_SEPARATOR,
@@ -37,7 +43,7 @@ __status__ = 'Production'
 __all__ = [
     'VIEW_NAME_SUBSTITUTION_PATTERNS', 'beautify_view_name',
     'create_builtin_transform', 'node_to_builtin_transform',
-    'node_to_colorspace', 'generate_config_aces'
+    'node_to_builtin_transforms', 'node_to_colorspace', 'generate_config_aces'
 ]
 
 VIEW_NAME_SUBSTITUTION_PATTERNS = {
@@ -52,6 +58,15 @@ VIEW_NAME_SUBSTITUTION_PATTERNS = {
 VIEW_NAME_SUBSTITUTION_PATTERNS : dict
 """
 
+_SKIP_NODES = frozenset(
+    [ACES_CONFIG_REFERENCE_COLORSPACE, ACES_CONFIG_OUTPUT_ENCODING_COLORSPACE])
+"""
+*aces-dev* conversion graph nodes not generated as part of the family
+colorspaces.
+
+_SKIP_NODES : frozenset
+"""
+
 
 def beautify_view_name(name):
     """
@@ -72,6 +87,8 @@ def beautify_view_name(name):
     --------
     >>> beautify_view_name('Rec. 709 (100 nits) dim')
     'Rec. 709'
+    >>> beautify_view_name('Output - P3-D60 (48 nits)')
+    'P3-D60'
     """
 
     return beautify_name(name, VIEW_NAME_SUBSTITUTION_PATTERNS)
@@ -96,8 +113,6 @@ def create_builtin_transform(style):
         *OpenColorIO* builtin transform for given style.
     """
 
-    import PyOpenColorIO as ocio
-
     builtin_transform = ocio.BuiltinTransform()
 
     try:
@@ -131,11 +146,24 @@ def node_to_builtin_transform(graph, node, direction='Forward'):
     -------
     BuiltinTransform
         *OpenColorIO* builtin transform.
+
+    Examples
+    --------
+    >>> ctl_transforms = classify_aces_ctl_transforms(
+    ...     discover_aces_ctl_transforms())
+    >>> graph = build_aces_conversion_graph(ctl_transforms)
+    >>> node_to_builtin_transform(graph, 'ACEScsc/ACEScc')
+    ... # doctest: +ELLIPSIS
+    <BuiltinTransform ...style = ACEScc_to_ACES2065-1>
+    >>> print(node_to_builtin_transform(graph, 'ACES2065-1'))
+    None
     """
 
-    import PyOpenColorIO as ocio
     from networkx.exception import NetworkXNoPath
 
+    if node == ACES_CONFIG_REFERENCE_COLORSPACE:
+        return
+
     try:
         transform_styles = []
 
@@ -146,16 +174,18 @@ def node_to_builtin_transform(graph, node, direction='Forward'):
         if not path:
             return
 
-        verbose_path = " --> ".join(
-            dict.fromkeys(itertools.chain.from_iterable(path)))
-        logging.debug(f'Creating "BuiltinTransform" with {verbose_path} path.')
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            verbose_path = " --> ".join(
+                dict.fromkeys(itertools.chain.from_iterable(path)))
+            logging.debug(
+                f'Creating "BuiltinTransform" with {verbose_path} path.')
 
+        separator = ACES_CONFIG_BUILTIN_TRANSFORM_NAME_SEPARATOR
         for edge in path:
             source, target = edge
             transform_styles.append(
-                f'{source.split(NODE_NAME_SEPARATOR)[-1]}'
-                f'{ACES_CONFIG_BUILTIN_TRANSFORM_NAME_SEPARATOR}'
-                f'{target.split(NODE_NAME_SEPARATOR)[-1]}')
+                source.rpartition(NODE_NAME_SEPARATOR)[2] + separator +
+                target.rpartition(NODE_NAME_SEPARATOR)[2])
 
         if len(transform_styles) == 1:
             builtin_transform = create_builtin_transform(transform_styles[0])
@@ -175,9 +205,43 @@ def node_to_builtin_transform(graph, node, direction='Forward'):
             f'No path to {ACES_CONFIG_REFERENCE_COLORSPACE} for {node}!')
 
 
+@required('NetworkX')
+@required('OpenColorIO')
+def node_to_builtin_transforms(graph, node):
+    """
+    Generates the *OpenColorIO* builtin transforms to and from the reference
+    for given *aces-dev* conversion graph node.
+
+    Parameters
+    ----------
+    graph : DiGraph
+        *aces-dev* conversion graph.
+    node : unicode
+        Node name to generate the *OpenColorIO* builtin transforms for.
+
+    Returns
+    -------
+    tuple
+        *OpenColorIO* builtin transforms to and from the reference.
+
+    Examples
+    --------
+    >>> ctl_transforms = classify_aces_ctl_transforms(
+    ...     discover_aces_ctl_transforms())
+    >>> graph = build_aces_conversion_graph(ctl_transforms)
+    >>> node_to_builtin_transforms(graph, 'ACEScsc/ACEScc')
+    ... # doctest: +ELLIPSIS
+    (<BuiltinTransform ...style = ACEScc_to_ACES2065-1>, None)
+    """
+
+    return (node_to_builtin_transform(graph, node),
+            node_to_builtin_transform(graph, node, 'Reverse'))
+
+
 def node_to_colorspace(graph,
                        node,
-                       describe=ColorspaceDescriptionStyle.LONG_UNION):
+                       describe=ColorspaceDescriptionStyle.LONG_UNION,
+                       ctl_transform=None):
     """
     Generates the *OpenColorIO* colorspace for given *aces-dev* conversion
     graph node.
@@ -191,6 +255,9 @@ def node_to_colorspace(graph,
     describe : int, optional
         Any value from the
         :class:`opencolorio_config_aces.ColorspaceDescriptionStyle` enum.
+    ctl_transform : CTLTransform, optional
+        *ACES* *CTL* transform of the node, retrieved from the graph if not
+        given.
 
     Returns
     -------
@@ -198,13 +265,16 @@ def node_to_colorspace(graph,
         *OpenColorIO* colorspace.
     """
 
-    ctl_transform = node_to_ctl_transform(graph, node)
+    if ctl_transform is None:
+        ctl_transform = node_to_ctl_transform(graph, node)
+
+    to_reference, from_reference = node_to_builtin_transforms(graph, node)
 
     colorspace = ctl_transform_to_colorspace(
         ctl_transform,
         describe=describe,
-        to_reference=node_to_builtin_transform(graph, node),
-        from_reference=node_to_builtin_transform(graph, node, 'Reverse'))
+        to_reference=to_reference,
+        from_reference=from_reference)
 
     return colorspace
 
@@ -250,9 +320,19 @@ def generate_config_aces(config_name=None,
         *OpenColorIO* colorspaces and
         :class:`opencolorio_config_aces.config.reference.CTLTransform` class
         instances.
-    """
 
-    import PyOpenColorIO as ocio
+    Examples
+    --------
+    >>> config, data, colorspaces = generate_config_aces(
+    ...     validate=False, additional_data=True)
+    >>> data.active_displays == sorted(data.active_displays)
+    True
+    >>> data.active_views == list(
+    ...     dict.fromkeys(view['view'] for view in data.views))
+    True
+    >>> data.active_views[-1]
+    'Utility - Raw'
+    """
 
     ctl_transforms = discover_aces_ctl_transforms()
     classified_ctl_transforms = classify_aces_ctl_transforms(ctl_transforms)
@@ -291,47 +371,61 @@ def generate_config_aces(config_name=None,
         raw_colorspace,
     ]
 
+    # The nodes are grouped by family directly from their "data" attribute,
+    # i.e. the "CTL" transform, which is kept alongside for the colorspaces.
+    family_nodes = defaultdict(list)
+    for node, ctl_transform in graph.nodes(data='data'):
+        if node not in _SKIP_NODES:
+            family_nodes[ctl_transform.family].append((node, ctl_transform))
+
+    add_display = displays.add
+    append_view = views.append
+
     for family in ('csc', 'input_transform', 'lmt', 'output_transform'):
         family_colourspaces = []
-        for node in filter_nodes(graph, [lambda x: x.family == family]):
-            if node in (ACES_CONFIG_REFERENCE_COLORSPACE,
-                        ACES_CONFIG_OUTPUT_ENCODING_COLORSPACE):
-                continue
-
-            colorspace = node_to_colorspace(graph, node, describe)
+        for node, ctl_transform in family_nodes[family]:
+            colorspace = node_to_colorspace(graph, node, describe,
+                                            ctl_transform)
 
             family_colourspaces.append(colorspace)
 
             if family == 'output_transform':
-                display = beautify_display_name(
-                    node_to_ctl_transform(graph, node).genus)
-                displays.add(display)
-                view = beautify_view_name(colorspace.getName())
-                views.append({
+                colorspace_name = colorspace.getName()
+                display = beautify_display_name(ctl_transform.genus)
+                add_display(display)
+                append_view({
                     'display': display,
-                    'view': view,
-                    'colorspace': colorspace.getName()
+                    'view': beautify_view_name(colorspace_name),
+                    'colorspace': colorspace_name
                 })
 
             if additional_data:
-                colorspaces_to_ctl_transforms[colorspace] = (
-                    node_to_ctl_transform(graph, node))
+                colorspaces_to_ctl_transforms[colorspace] = ctl_transform
 
         colorspaces += family_colourspaces
 
-    views = sorted(views, key=lambda x: (x['display'], x['view']))
-    displays = sorted(list(displays))
+    views = sorted(views, key=itemgetter('display', 'view'))
     if 'sRGB' in displays:
-        displays.insert(0, displays.pop(displays.index('sRGB')))
+        displays = ['sRGB'] + sorted(displays - {'sRGB'})
+    else:
+        displays = sorted(displays)
 
+    raw_colorspace_name = raw_colorspace.getName()
+    raw_view = beautify_view_name(raw_colorspace_name)
     for display in displays:
-        view = beautify_view_name(raw_colorspace.getName())
         views.append({
             'display': display,
-            'view': view,
-            'colorspace': raw_colorspace.getName()
+            'view': raw_view,
+            'colorspace': raw_colorspace_name
         })
 
+    active_views = []
+    seen_views = set()
+    for view in views:
+        if view['view'] not in seen_views:
+            seen_views.add(view['view'])
+            active_views.append(view['view'])
+
     data = ConfigData(
         description='The "Academy Color Encoding System" reference config.',
         roles={
@@ -340,7 +434,7 @@ def generate_config_aces(config_name=None,
         colorspaces=colorspaces,
         views=views,
         active_displays=displays,
-        active_views=list(dict.fromkeys([view['view'] for view in views])),
+        active_views=active_views,
         file_rules=[{
             'name': 'Default',
             'colorspace': 'CSC - ACEScg'
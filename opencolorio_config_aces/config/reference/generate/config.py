@@ -11,6 +11,7 @@ Defines various objects related to the generation of the *aces-dev* reference
 """
 
 import csv
+import functools
 import logging
 import re
 from collections import defaultdict
@@ -235,10 +236,33 @@ class ColorspaceDescriptionStyle(Flag):
     LONG_UNION = ACES | OPENCOLORIO | LONG
 
 
+@functools.lru_cache()
+def _compile_substitution_patterns(patterns):
+    """
+    Compiles given regular expression patterns and substitution pairs.
+
+    Parameters
+    ----------
+    patterns : tuple
+        Regular expression patterns and substitution pairs.
+
+    Returns
+    -------
+    tuple
+        Compiled regular expression patterns and substitution pairs.
+    """
+
+    return tuple((re.compile(pattern), substitution)
+                 for pattern, substitution in patterns)
+
+
 def beautify_name(name, patterns):
     """
     Beautifies given name by applying in succession the given patterns.
 
+    The patterns are compiled once per distinct set of patterns and
+    substitutions, thus modifying a patterns dictionary is still honoured.
+
     Parameters
     ----------
     name : unicode
@@ -258,10 +282,13 @@ def beautify_name(name, patterns):
     ...     'Rec709_100nits_dim',
     ...     COLORSPACE_NAME_SUBSTITUTION_PATTERNS)
     'Rec. 709 (100 nits) dim'
+    >>> beautify_name('foobar', {'(foo)(bar)': '\\\\2\\\\1'})
+    'barfoo'
     """
 
-    for pattern, substitution in patterns.items():
-        name = re.sub(pattern, substitution, name)
+    for regex, substitution in _compile_substitution_patterns(
+            tuple(patterns.items())):
+        name = regex.sub(substitution, name)
 
     return name.strip()
 